@@ -1,17 +1,42 @@
+import asyncio
+import collections
 import concurrent.futures
 import json
 import os
-import shutil
+import queue
+import re
 import sys
 import threading
 import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from zipfile import ZipFile, ZIP_DEFLATED
+from zipfile import ZipFile, ZipInfo, ZIP64_LIMIT, ZIP_DEFLATED, ZIP_STORED
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from webdav3.client import Client
 
+try:
+    # Optional aiohttp drives all downloads from one event loop instead of a thread per connection
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    # Optional orjson parses large memories_history.json exports noticeably faster than json
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional ISA-L bindings produce compatible deflate streams several times faster than zlib
+    from isal import isal_zlib as _zlib
+except ImportError:
+    import zlib as _zlib
+
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
@@ -29,8 +54,11 @@ def get_desktop_dir() -> Path:
 
 def read_memories_json(json_path: Path):
     # Load Snapchat memories JSON file (supports "Saved Media" or flat list formats)[web:14][web:27]
-    with json_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    if orjson is not None:
+        data = orjson.loads(json_path.read_bytes())
+    else:
+        with json_path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
 
     if isinstance(data, dict) and "Saved Media" in data:
         memories = data["Saved Media"]
@@ -57,30 +85,188 @@ def build_output_dir(base_name: str = "Snapchat_Memories_Backup") -> Path:
     return out
 
 
+PART_SUFFIX = ".part"
+COPY_BUFFER_SIZE = 1 << 20  # 1 MiB chunks keep multi-MB videos to a handful of read/write calls
+
+_thread_buffers = threading.local()
+
+
+def get_copy_buffer() -> memoryview:
+    # Return a reusable 1 MiB buffer owned by the calling thread
+    buf = getattr(_thread_buffers, "buf", None)
+    if buf is None:
+        buf = _thread_buffers.buf = memoryview(bytearray(COPY_BUFFER_SIZE))
+    return buf
+
+
+def write_all(write, data):
+    # Hand every byte of data to write(), unbuffered files may write less than asked
+    view = memoryview(data)
+    while view:
+        view = view[write(view):]
+
+
+def copy_stream(readinto, write=None, limit: int | None = None, on_chunk=None) -> int:
+    # Pump bytes from a readinto() callable to a write() callable through the thread's 1 MiB buffer
+    # limit stops after that many bytes, on_chunk sees every chunk first (e.g. a running CRC)
+    # write may be None to only feed on_chunk, returns the number of bytes copied
+    buf = get_copy_buffer()
+    total = 0
+    while limit is None or total < limit:
+        n = readinto(buf if limit is None else buf[:min(len(buf), limit - total)])
+        if not n:
+            break
+        view = buf[:n]
+        if on_chunk is not None:
+            on_chunk(view)
+        if write is not None:
+            write_all(write, view)
+        total += n
+    return total
+
+
+class RunningCrc:
+    # on_chunk hook for copy_stream that keeps the CRC32 of everything it has seen
+    def __init__(self):
+        self.value = 0
+
+    def update(self, data):
+        self.value = _zlib.crc32(data, self.value)
+
+
+def fast_copy(src_fd: int, dst_fd: int, size: int):
+    # Copy size bytes between two file descriptors from their current positions
+    # Prefer kernel-side copies (copy_file_range, then sendfile) and fall back to a 1 MiB read/write loop
+    remaining = size
+    if remaining and hasattr(os, "copy_file_range"):
+        try:
+            while remaining:
+                n = os.copy_file_range(src_fd, dst_fd, remaining)
+                if not n:
+                    break
+                remaining -= n
+        except OSError:
+            pass  # EXDEV, ENOSYS, unsupported filesystem, continue from where it stopped
+    if remaining and sys.platform.startswith("linux"):
+        try:
+            while remaining:
+                n = os.sendfile(dst_fd, src_fd, None, min(remaining, 1 << 30))
+                if not n:
+                    break
+                remaining -= n
+        except OSError:
+            pass
+    if remaining:
+        with open(src_fd, "rb", buffering=0, closefd=False) as src:
+            remaining -= copy_stream(src.readinto, lambda view: os.write(dst_fd, view), limit=remaining)
+    if remaining:
+        raise OSError(f"Source ended {remaining} bytes early while copying")
+
+
+@contextmanager
+def atomic_write(out_path: Path, size: int | None = None):
+    # Write into "<name>.part" and only rename it to out_path once the block finished without error
+    # A crash therefore never leaves a truncated file that a re-run would treat as downloaded
+    # When the final size is known it is preallocated so the filesystem can lay the file out contiguously
+    tmp = out_path.with_name(out_path.name + PART_SUFFIX)
+    try:
+        with open(tmp, "wb", buffering=0) as f:
+            if size and hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(f.fileno(), 0, size)
+                except OSError:
+                    pass  # not supported by this filesystem, write normally
+            yield f
+            if size:
+                f.truncate()
+        os.replace(tmp, out_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def promote_existing(source: Path, target: Path):
+    # Copy an already downloaded memory (e.g. from a previous backup run) into the current backup
+    # target.parent must exist already, _plan creates every year folder before the workers start
+    size = source.stat().st_size
+    with open(source, "rb") as src, atomic_write(target, size) as dst:
+        fast_copy(src.fileno(), dst.fileno(), size)
+
+
+# Characters not allowed in Windows/Linux filenames, replaced in a single translate pass
+BAD_FILENAME_CHARS = str.maketrans({ch: "_" for ch in '<>:"/\\|?*'})
+
+
 def sanitize_filename(name: str) -> str:
     # Sanitize filenames for Windows/Linux compatibility
-    bad = '<>:"/\\|?*'
-    for ch in bad:
-        name = name.replace(ch, "_")
-    return name.strip()
+    return name.translate(BAD_FILENAME_CHARS).strip()
 
 
 # multi-threaded memories downloader
 
+DATE_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S")
+
+# Snapchat's CDN answers 429/503 under load, these are retried with exponential backoff instead of failing
+RETRY_STATUSES = (408, 429, 500, 502, 503, 504)
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.5
+
+# Media is already compressed, asking for identity encoding keeps the body a straight socket-to-disk copy
+IDENTITY_HEADERS = {"Accept-Encoding": "identity"}
+
+# Snap id from the download link, "&mid=" anywhere wins (lookahead at the start), else the first "id="
+SNAP_ID_RE = re.compile(r"^(?=.*?&mid=([^&]*))|id=([^&]*)")
+
+
+@dataclass(slots=True)
+class Plan:
+    # Everything a worker needs for one memory, computed once before any download starts
+    idx: int
+    dl_link: str
+    out_path: Path
+    skip: bool
+
+
 class MemoryDownloader:
-    def __init__(self, memories, output_root: Path, max_workers: int = 16, status_callback=None, log_callback=None):
+    def __init__(self, memories, output_root: Path, max_workers: int = 16, status_callback=None, log_callback=None,
+                 reuse_root: Path | None = None):
         # Initialize downloader with memories list, output directory and worker count
+        # Files already present under reuse_root (a previous backup) are copied instead of downloaded
         self.memories = memories
         self.output_root = output_root
+        self.reuse_root = reuse_root
         self.max_workers = max_workers
-        self.lock = threading.Lock()
+        # Token POSTs are small, a separate set of resolvers keeps them from holding download slots
+        self.token_workers = min(32, max_workers)
         self.total = len(memories)
+        # Counters are only touched by the thread driving the downloads, workers return their outcome instead
         self.completed = 0
         self.skipped = 0
         self.failed = 0
         self.status_callback = status_callback
         self.log_callback = log_callback
 
+        # One pooled session shared by all workers so connections to Snapchat are kept alive
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=max_workers,
+            pool_maxsize=max_workers + self.token_workers,
+            pool_block=True,
+            max_retries=Retry(
+                total=RETRY_ATTEMPTS + 1,
+                connect=RETRY_ATTEMPTS,
+                read=RETRY_ATTEMPTS,
+                status=RETRY_ATTEMPTS,
+                backoff_factor=RETRY_BACKOFF,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=frozenset(["GET", "POST"]),
+                raise_on_status=False,
+                respect_retry_after_header=True,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def _update_status(self, text: str):
         # Update status text via callback if available
         if self.status_callback:
@@ -96,9 +282,15 @@ class MemoryDownloader:
 
     def _parse_date(self, memory) -> datetime:
         # Parse the "Date" field from Snapchat memories JSON, fallback to now on failure[web:27]
-        raw = memory.get("Date") or memory.get("date") or ""
-        raw = raw.replace(" UTC", "").strip()
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"):
+        # fromisoformat is a fixed C parser, strptime is only tried for anything it rejects
+        raw = (memory.get("Date") or memory.get("date") or "").removesuffix(" UTC").strip()
+        if not raw:
+            return datetime.now()
+        try:
+            return datetime.fromisoformat(raw.replace(" ", "T"))
+        except ValueError:
+            pass
+        for fmt in DATE_FORMATS:
             try:
                 return datetime.strptime(raw, fmt)
             except ValueError:
@@ -121,11 +313,12 @@ class MemoryDownloader:
             raise ValueError("No 'Download Link' in memory entry")
         return link
 
-    def _safe_request(self, session: requests.Session, method: str, url: str, **kwargs):
-        # Perform a HTTP request with sane timeouts and error handling[web:186]
+    def _safe_request(self, method: str, url: str, **kwargs):
+        # Perform a HTTP request on the shared session with sane timeouts and error handling[web:186]
+        # Transient errors are already retried by the adapter, anything still failing here is final
         kwargs.setdefault("timeout", (5, 60))
         try:
-            resp = session.request(method, url, **kwargs)
+            resp = self.session.request(method, url, **kwargs)
             resp.raise_for_status()
             return resp
         except requests.exceptions.Timeout:
@@ -133,76 +326,303 @@ class MemoryDownloader:
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"Network error: {e}")
 
-    def _download_single(self, idx: int, memory) -> Path | None:
-        # Download a single memory item and save it into a dated subfolder
-        try:
-            date = self._parse_date(memory)
-            ext = self._infer_extension(memory)
-            dl_link = self._get_download_endpoint(memory)
-
-            snap_id = "id"
-            if "&mid=" in dl_link:
-                snap_id = dl_link.split("&mid=", 1)[1].split("&", 1)[0]
-            elif "id=" in dl_link:
-                snap_id = dl_link.split("id=", 1)[1].split("&", 1)[0]
+    def _plan(self) -> list[Plan]:
+        # Resolve link, file name and target folder of every memory in one pass before downloading
+        # Entries that cannot be planned are counted as failed right away
+        # Each year folder is listed once with scandir instead of stat-ing every output file
+        plans = []
+        existing = {}
+        missing_dirs = []
+        bad_dirs = {}
+        planned = set()
+        for idx, memory in enumerate(self.memories):
+            try:
+                date = self._parse_date(memory)
+                ext = self._infer_extension(memory)
+                dl_link = self._get_download_endpoint(memory)
+            except Exception as e:
+                self._record("fail")
+                self._report_failure(idx, e)
+                continue
 
-            fname = f"{date.strftime('%Y-%m-%d_%H%M%S')}_{snap_id}{ext}"
-            fname = sanitize_filename(fname)
+            m = SNAP_ID_RE.search(dl_link)
+            if m is None:
+                snap_id = "id"
+            else:
+                snap_id = m[1] if m[1] is not None else m[2]
 
+            stem = sanitize_filename(f"{date.strftime('%Y-%m-%d_%H%M%S')}_{snap_id}")
             year_dir = self.output_root / str(date.year)
-            ensure_dir(year_dir)
-            out_path = year_dir / fname
-
-            if out_path.exists():
-                with self.lock:
-                    self.skipped += 1
-                    self.completed += 1
-                return out_path
-
-            session = requests.Session()
-
-            token_resp = self._safe_request(session, "POST", dl_link)
-            real_url = token_resp.text.strip()
-
-            media_resp = self._safe_request(session, "GET", real_url, stream=True)
-            with out_path.open("wb") as f:
-                shutil.copyfileobj(media_resp.raw, f)
-
-            with self.lock:
-                self.completed += 1
+            names = existing.get(year_dir)
+            if names is None:
+                try:
+                    with os.scandir(year_dir) as it:
+                        names = {entry.name for entry in it if entry.is_file()}
+                except FileNotFoundError:
+                    names = set()
+                    missing_dirs.append(year_dir)
+                except OSError as e:
+                    names = set()
+                    bad_dirs[year_dir] = e  # e.g. the year path is a file or not readable
+                existing[year_dir] = names
+
+            # Memories sharing a timestamp and id get numbered suffixes in JSON order, so two workers
+            # never write the same file and re-runs map every memory to the same name again
+            fname = f"{stem}{ext}"
+            n = 1
+            while year_dir / fname in planned:
+                n += 1
+                fname = f"{stem}_{n}{ext}"
+            planned.add(year_dir / fname)
+            plans.append(Plan(idx, dl_link, year_dir / fname, fname in names))
+
+        # Only year folders that scandir could not find need creating, once each before the workers start
+        for year_dir in missing_dirs:
+            try:
+                ensure_dir(year_dir)
+            except OSError as e:
+                bad_dirs[year_dir] = e
+
+        # A year folder that cannot be used fails its own memories, not the whole backup
+        if bad_dirs:
+            usable = []
+            for plan in plans:
+                e = bad_dirs.get(plan.out_path.parent)
+                if e is None:
+                    usable.append(plan)
+                else:
+                    self._record("fail")
+                    self._report_failure(plan.idx, e)
+            plans = usable
+        return plans
+
+    def _reuse_previous(self, plan: Plan) -> bool:
+        # Copy the memory from the previous backup if it is there, returns True when nothing needs downloading
+        if self.reuse_root is None:
+            return False
+        previous = self.reuse_root / plan.out_path.relative_to(self.output_root)
+        if not previous.exists():
+            return False
+        promote_existing(previous, plan.out_path)
+        return True
+
+    def _report_failure(self, idx: int, e: Exception):
+        # Surface a failed memory in status and log
+        # A broken status/log callback must not take a pipeline worker down with it
+        try:
+            self._update_status(f"[ERROR] Memory {idx+1}/{self.total} failed: {e}")
+            self._log(f"[ERROR] Memory {idx+1}/{self.total} failed: {e}")
+        except Exception:
+            pass
 
-            return out_path
+    def _record(self, outcome: str):
+        # Tally one finished memory ("ok", "skip" or "fail")
+        self.completed += 1
+        if outcome == "skip":
+            self.skipped += 1
+        elif outcome == "fail":
+            self.failed += 1
+
+    def _update_progress(self):
+        # Show the progress line every 16 memories and once everything is done
+        if self.completed % 16 == 0 or self.completed == self.total:
+            self._update_status(self._progress_text())
+
+    def _progress_text(self) -> str:
+        # Build the progress line shown while downloading
+        done = self.completed
+        percent = (done / self.total) * 100 if self.total else 100
+        return (
+            f"Progress {done}/{self.total} ({percent:.1f}%) "
+            f"OK {self.completed - self.skipped - self.failed} "
+            f"Skip {self.skipped} Fail {self.failed}"
+        )
 
+    def _resolve_token(self, plan: Plan) -> str:
+        # First stage: trade the Snapchat download link for the real media URL
+        token_resp = self._safe_request("POST", plan.dl_link)
+        return token_resp.text.strip()
+
+    def _fetch_media(self, plan: Plan, real_url: str):
+        # Second stage: stream the media into its dated subfolder
+        # Close the streamed response so its connection goes back to the pool
+        with self._safe_request("GET", real_url, stream=True, headers=IDENTITY_HEADERS) as media_resp:
+            media_resp.raw.decode_content = False
+            size = int(media_resp.headers.get("Content-Length") or 0)
+            with atomic_write(plan.out_path, size) as f:
+                copy_stream(media_resp.raw.readinto, f.write)
+
+    def _token_stage(self, plan: Plan, download_pool, slots: threading.Semaphore, results: queue.Queue):
+        # Runs on the token pool, hands the resolved URL over to the download pool
+        # Unless the hand-over succeeded exactly one outcome is posted here, whatever goes wrong
+        outcome = "fail"
+        handed_over = False
+        slots.acquire()
+        try:
+            if self._reuse_previous(plan):
+                outcome = "skip"
+                return
+            real_url = self._resolve_token(plan)
+            download_pool.submit(self._download_stage, plan, real_url, slots, results)
+            handed_over = True
         except Exception as e:
-            with self.lock:
-                self.failed += 1
-                self.completed += 1
-            self._update_status(f"[ERROR] Memory {idx+1}/{self.total} failed: {e}")
-            self._log(f"[ERROR] Memory {idx+1}/{self.total} failed: {e}")
-            return None
+            self._report_failure(plan.idx, e)
+        finally:
+            if not handed_over:
+                slots.release()
+                results.put(outcome)
+
+    def _download_stage(self, plan: Plan, real_url: str, slots: threading.Semaphore, results: queue.Queue):
+        # Runs on the download pool, always posts exactly one outcome back to download_all
+        outcome = "fail"
+        try:
+            self._fetch_media(plan, real_url)
+            outcome = "ok"
+        except Exception as e:
+            self._report_failure(plan.idx, e)
+        finally:
+            slots.release()
+            results.put(outcome)
+
+    def _download_all_threaded(self, plans: list[Plan]):
+        # Download with two chained thread pools, used when aiohttp is not installed
+        # A memory waiting on its token POST never blocks another memory's GET
+        # slots caps resolved-but-not-downloaded URLs so they don't sit in the queue long enough to expire
+        results = queue.Queue()
+        slots = threading.Semaphore(self.max_workers * 2)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as download_pool, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=self.token_workers) as token_pool:
+            for plan in plans:
+                token_pool.submit(self._token_stage, plan, download_pool, slots, results)
+
+            # Wake up exactly when a download finishes instead of polling
+            self._update_status(self._progress_text())
+            for _ in plans:
+                self._record(results.get())
+                self._update_progress()
+
+    async def _safe_request_async(self, session, method: str, url: str, **kwargs):
+        # aiohttp counterpart of _safe_request, the caller has to release the returned response
+        # Retries mirror the requests adapter: RETRY_STATUSES and connection errors, exponential backoff
+        for attempt in range(RETRY_ATTEMPTS + 1):
+            last = attempt == RETRY_ATTEMPTS
+            delay = RETRY_BACKOFF * (2 ** attempt)
+            try:
+                resp = await session.request(method, url, **kwargs)
+            except asyncio.TimeoutError:
+                if last:
+                    raise RuntimeError("Network timeout while contacting Snapchat servers")
+            except aiohttp.ClientError as e:
+                if last:
+                    raise RuntimeError(f"Network error: {e}")
+            else:
+                if resp.status not in RETRY_STATUSES or last:
+                    try:
+                        resp.raise_for_status()
+                    except aiohttp.ClientError as e:
+                        raise RuntimeError(f"Network error: {e}")
+                    return resp
+                retry_after = resp.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = int(retry_after)
+                resp.release()
+            await asyncio.sleep(delay)
+
+    async def _token_worker(self, session, token_queue: asyncio.Queue, download_queue: asyncio.Queue,
+                            results: asyncio.Queue):
+        # Resolve media URLs until every plan has been taken, feeding the download workers
+        while True:
+            try:
+                plan = token_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            # Exactly one outcome per plan, posted here unless the plan reached the download queue
+            outcome = "fail"
+            handed_over = False
+            try:
+                # Copying from a previous backup is blocking file I/O, keep it off the event loop (only when opted in)
+                if self.reuse_root is not None and await asyncio.to_thread(self._reuse_previous, plan):
+                    outcome = "skip"
+                    continue
+                async with await self._safe_request_async(session, "POST", plan.dl_link) as token_resp:
+                    real_url = (await token_resp.text()).strip()
+                await download_queue.put((plan, real_url))
+                handed_over = True
+            except Exception as e:
+                self._report_failure(plan.idx, e)
+            finally:
+                if not handed_over:
+                    results.put_nowait(outcome)
+
+    async def _download_worker(self, session, download_queue: asyncio.Queue, results: asyncio.Queue):
+        # Stream resolved media URLs to disk, runs until cancelled by _download_all_async
+        while True:
+            plan, real_url = await download_queue.get()
+            outcome = "fail"
+            try:
+                # The session already asks for identity encoding, see _download_all_async
+                async with await self._safe_request_async(session, "GET", real_url) as media_resp:
+                    # Plain writes are fine here, 1 MiB chunks land in the page cache without blocking the loop
+                    with atomic_write(plan.out_path, media_resp.content_length) as f:
+                        async for chunk in media_resp.content.iter_chunked(COPY_BUFFER_SIZE):
+                            write_all(f.write, chunk)
+                outcome = "ok"
+            except Exception as e:
+                self._report_failure(plan.idx, e)
+            finally:
+                results.put_nowait(outcome)
+
+    async def _download_all_async(self, plans: list[Plan]):
+        # Download everything from a single event loop, token resolvers feed a bounded queue of download workers
+        connector = aiohttp.TCPConnector(
+            limit=self.max_workers + self.token_workers,
+            limit_per_host=self.max_workers,
+            enable_cleanup_closed=True,
+        )
+        timeout = aiohttp.ClientTimeout(sock_connect=5, sock_read=60)
+        # Like the requests path, bodies are written as received: identity is asked for on every request and
+        # auto_decompress is off, so a CDN that gzips anyway cannot silently change the bytes that reach disk
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout, headers=IDENTITY_HEADERS, auto_decompress=False
+        ) as session:
+            token_queue = asyncio.Queue()
+            for plan in plans:
+                token_queue.put_nowait(plan)
+            download_queue = asyncio.Queue(maxsize=self.max_workers)
+            results = asyncio.Queue()
+
+            workers = [
+                asyncio.create_task(self._token_worker(session, token_queue, download_queue, results))
+                for _ in range(self.token_workers)
+            ] + [
+                asyncio.create_task(self._download_worker(session, download_queue, results))
+                for _ in range(self.max_workers)
+            ]
+            try:
+                self._update_status(self._progress_text())
+                for _ in plans:
+                    self._record(await results.get())
+                    self._update_progress()
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
 
     def download_all(self):
-        # Run multi-threaded download for all memories with a simple progress display
+        # Download all memories with a simple progress display, async when aiohttp is available
         self._log(f"Starting download of {self.total} memories with {self.max_workers} parallel tasks...")
         start = time.time()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = [
-                executor.submit(self._download_single, idx, mem)
-                for idx, mem in enumerate(self.memories)
-            ]
-
-            while True:
-                done = sum(f.done() for f in futures)
-                percent = (done / self.total) * 100 if self.total else 100
-                progress_text = (
-                    f"Progress {done}/{self.total} ({percent:.1f}%) "
-                    f"OK {self.completed - self.skipped - self.failed} "
-                    f"Skip {self.skipped} Fail {self.failed}"
-                )
-                self._update_status(progress_text)
-                if done == self.total:
-                    break
-                time.sleep(0.5)
+        # Files that are already there are counted here and never reach the workers
+        plans = []
+        for plan in self._plan():
+            if plan.skip:
+                self._record("skip")
+            else:
+                plans.append(plan)
+        if aiohttp is not None:
+            asyncio.run(self._download_all_async(plans))
+        else:
+            self._download_all_threaded(plans)
 
         elapsed = time.time() - start
         summary = (
@@ -216,8 +636,152 @@ class MemoryDownloader:
 
 # zipping and webdav upload
 
-def zip_folder(folder: Path, zip_path: Path, status_callback=None, log_callback=None):
-    # Zip an entire folder recursively into a single archive
+# Media formats that are already compressed, deflating them costs CPU for no size gain
+STORED_EXTENSIONS = {".jpg", ".jpeg", ".mp4", ".mov", ".png", ".webp", ".heic"}
+
+# Files above ZIP_STREAM_MIN are deflated straight into the archive instead of into a buffered payload,
+# smaller ones go to the worker pool with at most ZIP_INFLIGHT_BYTES of source data in flight
+ZIP_STREAM_MIN = 16 << 20
+ZIP_INFLIGHT_BYTES = 64 << 20
+
+
+# Streamed files are split into DEFLATE_BLOCK_SIZE blocks deflated on separate cores
+DEFLATE_BLOCK_SIZE = 4 << 20
+DEFLATE_WINDOW = 32 << 10
+
+
+def deflate_block(block: bytes, dictionary: bytes, level: int) -> bytes:
+    # Deflate one block primed with the previous block's tail, ending on a byte boundary (sync flush)
+    if dictionary:
+        compressor = _zlib.compressobj(level, _zlib.DEFLATED, -15, zdict=dictionary)
+    else:
+        compressor = _zlib.compressobj(level, _zlib.DEFLATED, -15)
+    return compressor.compress(block) + compressor.flush(_zlib.Z_SYNC_FLUSH)
+
+
+def compress_file(full_path: Path, rel_path: Path, level: int):
+    # Deflate one file into a raw stream (no zlib header) and return its ZipInfo and compressed payload
+    zinfo = ZipInfo.from_file(full_path, rel_path)
+    zinfo.compress_type = ZIP_DEFLATED
+    level = min(level, _zlib.Z_BEST_COMPRESSION)
+    compressor = _zlib.compressobj(level, _zlib.DEFLATED, -15)
+    chunks = []
+    crc = RunningCrc()
+
+    def deflate(view):
+        chunks.append(compressor.compress(view))
+        return len(view)
+
+    with open(full_path, "rb", buffering=0) as src:
+        copy_stream(src.readinto, deflate, on_chunk=crc.update)
+    chunks.append(compressor.flush())
+    payload = b"".join(chunks)
+    zinfo.CRC = crc.value
+    zinfo.compress_size = len(payload)
+    return zinfo, payload
+
+
+def write_stored(zf: ZipFile, full_path: Path, rel_path: Path):
+    # Store a file uncompressed, the CRC is computed first so the bytes can be copied by the kernel
+    zinfo = ZipInfo.from_file(full_path, rel_path)
+    zinfo.compress_type = ZIP_STORED
+    crc = RunningCrc()
+    with open(full_path, "rb", buffering=0) as src:
+        copy_stream(src.readinto, on_chunk=crc.update)
+        zinfo.CRC = crc.value
+        zinfo.compress_size = zinfo.file_size
+        src.seek(0)
+        write_precompressed(zf, zinfo, src)
+
+
+def start_entry(zf: ZipFile, zinfo: ZipInfo, zip64=None):
+    # Write the local header of a new entry at the end of the archive
+    # ZipFile has no public API for raw entries, so mirror what ZipFile.open(..., "w") does around the data
+    zf.fp.seek(zf.start_dir)
+    zinfo.header_offset = zf.fp.tell()
+    zf._writecheck(zinfo)
+    zf._didModify = True
+    zf.fp.write(zinfo.FileHeader(zip64))
+
+
+def finish_entry(zf: ZipFile, zinfo: ZipInfo):
+    # Register an entry whose data has been written after its local header
+    zf.start_dir = zf.fp.tell()
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+
+
+def write_precompressed(zf: ZipFile, zinfo: ZipInfo, payload):
+    # Append an entry whose payload is already compressed, bypassing ZipFile's own compressor
+    # payload is either bytes or an open file whose remaining compress_size bytes are copied verbatim
+    start_entry(zf, zinfo)
+    if isinstance(payload, bytes):
+        zf.fp.write(payload)
+    else:
+        zf.fp.flush()
+        fast_copy(payload.fileno(), zf.fp.fileno(), zinfo.compress_size)
+        zf.fp.seek(0, os.SEEK_END)  # resync the buffered file with the descriptor position
+    finish_entry(zf, zinfo)
+
+
+def write_streamed(zf: ZipFile, zinfo: ZipInfo, write_body):
+    # Append an entry whose compressed body is produced by write_body(write) straight into the archive
+    # write_body has to set zinfo.CRC and zinfo.file_size, the local header is patched afterwards
+    zip64 = zinfo.file_size * 1.05 > ZIP64_LIMIT  # same headroom ZipFile.open(..., "w") uses
+    zinfo.CRC = 0
+    zinfo.compress_size = 0
+    start_entry(zf, zinfo, zip64)
+    data_start = zf.fp.tell()
+    write_body(zf.fp.write)
+    end = zf.fp.tell()
+    zinfo.compress_size = end - data_start
+    if not zip64 and (zinfo.file_size > ZIP64_LIMIT or zinfo.compress_size > ZIP64_LIMIT):
+        raise RuntimeError(f"{zinfo.filename} grew past the ZIP64 limit while it was being zipped")
+    zf.fp.seek(zinfo.header_offset)
+    zf.fp.write(zinfo.FileHeader(zip64))
+    zf.fp.seek(end)
+    finish_entry(zf, zinfo)
+
+
+def parallel_deflate_file(zf: ZipFile, full_path: Path, rel_path: Path, level: int, executor, workers: int):
+    # pigz-style deflate of a single large file straight into the archive
+    # Blocks are deflated on the shared pool and written in order by this thread as they finish,
+    # sync-flushed blocks concatenate into one valid stream and a final empty block terminates it
+    zinfo = ZipInfo.from_file(full_path, rel_path)
+    zinfo.compress_type = ZIP_DEFLATED
+    level = min(level, _zlib.Z_BEST_COMPRESSION)
+    max_blocks = max(1, min(workers * 2, ZIP_INFLIGHT_BYTES // DEFLATE_BLOCK_SIZE))
+
+    def write_body(write):
+        blocks = collections.deque()
+        crc = RunningCrc()
+        size = 0
+        dictionary = b""
+        with open(full_path, "rb") as src:
+            while True:
+                block = src.read(DEFLATE_BLOCK_SIZE)
+                if not block:
+                    break
+                size += len(block)
+                crc.update(block)
+                blocks.append(executor.submit(deflate_block, block, dictionary, level))
+                dictionary = block[-DEFLATE_WINDOW:]
+                if len(blocks) >= max_blocks:
+                    write(blocks.popleft().result())
+        for fut in blocks:
+            write(fut.result())
+        write(b"\x03\x00")  # empty final block (BFINAL=1, fixed Huffman, end-of-block code)
+        zinfo.file_size = size
+        zinfo.CRC = crc.value
+
+    write_streamed(zf, zinfo, write_body)
+
+
+def zip_folder(folder: Path, zip_path: Path, level: int = 1, status_callback=None, log_callback=None):
+    # Zip an entire folder recursively, storing media as-is and deflating everything else at the given level
+    # Level 1 is the fast setting, higher levels shrink text/JSON a little more at a much higher CPU cost
+    # (isal only goes up to 3, higher values are clamped)
+    # Deflating runs on all cores (zlib releases the GIL), only this thread writes to the archive
     text = f"Zipping {folder} -> {zip_path}"
     if status_callback:
         status_callback(text)
@@ -226,13 +790,38 @@ def zip_folder(folder: Path, zip_path: Path, status_callback=None, log_callback=
     else:
         print(text)
 
-    with ZipFile(zip_path, "w", ZIP_DEFLATED) as zf:
+    workers = os.cpu_count() or 1
+    with ZipFile(zip_path, "w", ZIP_DEFLATED) as zf, \
+            concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {}  # future -> source bytes it is compressing
+        pending_bytes = 0
         for root, _, files in os.walk(folder):
             root_path = Path(root)
             for f in files:
+                if f.endswith(PART_SUFFIX):
+                    continue  # leftover from an interrupted download
                 full_path = root_path / f
                 rel_path = full_path.relative_to(folder)
-                zf.write(full_path, rel_path)
+                if full_path.suffix.lower() in STORED_EXTENSIONS:
+                    write_stored(zf, full_path, rel_path)
+                    continue
+
+                size = full_path.stat().st_size
+                if size > ZIP_STREAM_MIN:
+                    parallel_deflate_file(zf, full_path, rel_path, level, executor, workers)
+                    continue
+
+                # Bound the bytes held by compressed payloads waiting for this thread
+                while pending and pending_bytes + size > ZIP_INFLIGHT_BYTES:
+                    done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for fut in done:
+                        pending_bytes -= pending.pop(fut)
+                        write_precompressed(zf, *fut.result())
+                pending[executor.submit(compress_file, full_path, rel_path, level)] = size
+                pending_bytes += size
+
+        for fut in concurrent.futures.as_completed(pending):
+            write_precompressed(zf, *fut.result())
 
 
 def upload_webdav(zip_path: Path, webdav_url: str, username: str, password: str, remote_path: str,
@@ -298,6 +887,7 @@ class App:
 
         self.json_path_var = tk.StringVar()
         self.output_dir_var = tk.StringVar()
+        self.reuse_dir_var = tk.StringVar()
         self.concurrent_var = tk.IntVar(value=16)
         self.webdav_url_var = tk.StringVar()
         self.webdav_user_var = tk.StringVar()
@@ -307,8 +897,14 @@ class App:
 
         self.webdav_visible = False
 
+        # Status/log updates from worker threads are buffered here and flushed by a 100 ms UI tick
+        self.ui_lock = threading.Lock()
+        self._pending_status = None
+        self._pending_log = []
+
         self.create_widgets()
         self.apply_theme()
+        self.root.after(100, self._flush_ui)
 
     def apply_theme(self):
         # Apply light or dark theme colors to widgets[web:89]
@@ -399,6 +995,17 @@ class App:
         )
         row += 1
 
+        # Previous backup row (optional, files found there are copied instead of downloaded)
+        ttk.Label(self.main_frame, text="Previous backup (optional)").grid(
+            row=row, column=0, sticky="w", padx=5, pady=5
+        )
+        self.reuse_entry = ttk.Entry(self.main_frame, textvariable=self.reuse_dir_var, width=50)
+        self.reuse_entry.grid(row=row, column=1, padx=5, pady=5, ipady=ipady_entry, sticky="we")
+        ttk.Button(self.main_frame, text="Browse", command=self.browse_reuse_dir).grid(
+            row=row, column=2, padx=5, pady=5, sticky="we"
+        )
+        row += 1
+
         # Concurrency row
         ttk.Label(self.main_frame, text="Maximum parallel downloads").grid(
             row=row, column=0, sticky="w", padx=5, pady=5
@@ -503,20 +1110,37 @@ class App:
         if path:
             self.output_dir_var.set(path)
 
+    def browse_reuse_dir(self):
+        # Open directory chooser for a previous backup to copy existing files from
+        path = filedialog.askdirectory(
+            title="Select previous backup folder"
+        )
+        if path:
+            self.reuse_dir_var.set(path)
+
     def set_status(self, text: str):
-        # Thread-safe update of status label
-        def _update():
-            self.status_var.set(text)
-        self.root.after(0, _update)
+        # Thread-safe update of status label, only the latest text is shown on the next UI tick
+        with self.ui_lock:
+            self._pending_status = text
 
     def append_log(self, text: str):
-        # Append text to the log tab[web:111]
-        def _append():
+        # Queue text for the log tab, written in one batch on the next UI tick[web:111]
+        with self.ui_lock:
+            self._pending_log.append(text)
+
+    def _flush_ui(self):
+        # Publish buffered status and log text on the Tk main loop, then reschedule
+        with self.ui_lock:
+            status, self._pending_status = self._pending_status, None
+            batch, self._pending_log = self._pending_log, []
+        if status is not None:
+            self.status_var.set(status)
+        if batch:
             self.log_text.configure(state="normal")
-            self.log_text.insert("end", text)
+            self.log_text.insert("end", "".join(batch))
             self.log_text.see("end")
             self.log_text.configure(state="disabled")
-        self.root.after(0, _append)
+        self.root.after(100, self._flush_ui)
 
     def validate_inputs(self):
         # Validate required UI inputs before starting the backup
@@ -526,12 +1150,19 @@ class App:
         if not Path(json_path).exists():
             raise ValueError("Selected JSON file does not exist")
 
+        reuse_dir = self.reuse_dir_var.get().strip()
+        if reuse_dir and not Path(reuse_dir).is_dir():
+            raise ValueError("Selected previous backup folder does not exist")
+
         output_dir = self.output_dir_var.get().strip()
         if output_dir:
             output_root = Path(output_dir)
         else:
             output_root = build_output_dir()
 
+        if reuse_dir and Path(reuse_dir).resolve() == output_root.resolve():
+            raise ValueError("Previous backup folder must differ from the output folder")
+
         concurrent_downloads = int(self.concurrent_var.get())
         if concurrent_downloads < 1:
             concurrent_downloads = 1
@@ -547,6 +1178,7 @@ class App:
         return {
             "json_path": Path(json_path),
             "output_root": output_root,
+            "reuse_root": Path(reuse_dir) if reuse_dir else None,
             "concurrent": concurrent_downloads,
             "webdav_url": webdav_url if webdav_url else None,
             "webdav_user": webdav_user if webdav_user else None,
@@ -579,12 +1211,17 @@ class App:
             self.append_log("Loading memories JSON\n")
             memories = read_memories_json(json_path)
 
+            reuse_root = config["reuse_root"]
+            if reuse_root:
+                self.append_log(f"Reusing files from previous backup {reuse_root}\n")
+
             downloader = MemoryDownloader(
                 memories,
                 output_root,
                 max_workers=concurrent_downloads,
                 status_callback=self.set_status,
                 log_callback=self.append_log,
+                reuse_root=reuse_root,
             )
             downloader.download_all()
 
@@ -626,6 +1263,8 @@ class App:
             "In this app\n"
             "- Click 'Browse' next to 'memories_history.json' and select that file\n"
             "- Choose an output folder (or leave empty to use a timestamped folder on your Desktop)\n"
+            "- Optionally pick a previous backup folder, memories already saved there are copied instead of\n"
+            "  downloaded again (only use backups made by this version, older ones may contain cut-off files)\n"
             "- Optionally open 'WebDAV options' and fill in server URL, username, password,\n"
             "  and the remote ZIP path if you want the backup uploaded automatically\n"
             "- Set 'Maximum parallel downloads' higher for faster downloads if your connection can handle it\n"